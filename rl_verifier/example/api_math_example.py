@@ -1,9 +1,16 @@
-import requests
-import json
+import httpx
+import orjson
 
 # Server URL
 BASE_URL = "http://localhost:8000"
 
+# Shared client, so repeated requests reuse keep-alive connections
+client = httpx.Client(
+    base_url=BASE_URL,
+    timeout=60,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
 verification_info = {"type": "math_verifiable", "answer": {"value": "152"}}
 
 llm_output = """### Solution
@@ -14,10 +21,14 @@ llm_output = """### Solution
 Thus, the value of \( 100a + 10b + c \) is \( \\boxed{152} \)."""
 
 
-payload = {"llm_output": llm_output, "verification_info": json.dumps(verification_info)}
+payload = {"llm_output": llm_output, "verification_info": verification_info}
 
 try:
-    response = requests.post(f"{BASE_URL}/reward", json=payload)
+    response = client.post(
+        "/reward",
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
 
     if response.status_code == 200:
         result = response.json()
@@ -26,5 +37,5 @@ try:
         print(f"Error: {response.status_code}")
         print(f"Message: {response.json()['detail']}")
 
-except requests.exceptions.RequestException as e:
+except httpx.HTTPError as e:
     print(f"Request failed: {e}")
@@ -1,9 +1,16 @@
-import requests
-import json
+import httpx
+import orjson
 
 # Server URL
 BASE_URL = "http://localhost:8000"
 
+# Shared client, so repeated requests reuse keep-alive connections
+client = httpx.Client(
+    base_url=BASE_URL,
+    timeout=60,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
 verification_info = {
     "type": "swe_verifiable",
     "answer": {
@@ -18,10 +25,14 @@ def add_plus_one(a, b):\n    return a + b + 1
 ```"""
 
 
-payload = {"llm_output": llm_output, "verification_info": json.dumps(verification_info)}
+payload = {"llm_output": llm_output, "verification_info": verification_info}
 
 try:
-    response = requests.post(f"{BASE_URL}/reward", json=payload)
+    response = client.post(
+        "/reward",
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
 
     if response.status_code == 200:
         result = response.json()
@@ -30,5 +41,5 @@ try:
         print(f"Error: {response.status_code}")
         print(f"Message: {response.json()['detail']}")
 
-except requests.exceptions.RequestException as e:
+except httpx.HTTPError as e:
     print(f"Request failed: {e}")
@@ -5,9 +5,21 @@ from typing import Optional
 class Settings(BaseSettings):
     # Whether to use format verifier
     use_format_verifier: bool = True
-    
+
+    # Maximum number of items accepted by /reward/batch
+    max_batch_size: int = 128
+
+    # Number of scores of deterministic verifications to cache (0 disables the cache)
+    reward_cache_size: int = 100_000
+
+    # Minimum number of seconds between two attempts to initialize a verifier
+    # that failed to initialize (e.g. its backend was down)
+    verifier_init_retry_interval: float = 30.0
+
     # Code verification
     fusion_sandbox_url: Optional[str] = None
+    # Whether a partially passing solution gets a partial score
+    code_verifier_partial_credit: bool = True
 
     # LLM judge
     llm_judge_model: Optional[str] = None
@@ -15,6 +27,8 @@ class Settings(BaseSettings):
     llm_judge_api_key: Optional[str] = "EMPTY"
     llm_judge_max_tokens: Optional[int] = None
     llm_judge_temperature: Optional[float] = None
+    # Whether to check at startup that the judge model is served by the backend
+    llm_judge_validate_model: bool = False
 
     class Config:
         env_file = ".env"  # Load from a .env file if available
@@ -1,60 +1,176 @@
+import asyncio
+import hashlib
 import json
+import orjson
+import re
+import time
 
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel
+from collections import OrderedDict
+from typing import Literal, Union, get_args
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Json
+from pydantic_core import PydanticSerializationError
 from .verifier import (
     MathVerifier,
     CodeVerifier,
     SWEVerifier,
     LLMJudge,
     FormatVerifier,
-    VerifierInitializationError,
 )
 from .config import settings
 from .utils import get_assistant_response
 
+
+# A run of digits that may be an integer beyond 64 bits, which orjson turns
+# into a float or rejects, depending on its version
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+def _loads(body: bytes):
+    """Decode JSON with orjson, falling back to the stdlib json where they
+    differ: large integers and lone surrogates, which orjson rejects."""
+    if _LONG_DIGITS.search(body) is None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson instead of the stdlib json."""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = _loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
 app = FastAPI()
+app.router.route_class = ORJSONRoute
 
 
 def get_verifier(verification_type):
-    """Factory function to create verifiers on demand."""
+    """Factory function returning the shared verifier for a verification type."""
     if verification_type == "math_verifiable":
-        return MathVerifier()
+        return MathVerifier.get_instance()
     elif verification_type == "code_verifiable":
-        return CodeVerifier(base_url=settings.fusion_sandbox_url)
+        return CodeVerifier.get_instance(
+            base_url=settings.fusion_sandbox_url,
+            partial_credit=settings.code_verifier_partial_credit,
+        )
     elif verification_type == "swe_verifiable":
-        return SWEVerifier()
+        return SWEVerifier.get_instance()
     elif verification_type == "llm_judge":
-        return LLMJudge(
+        return LLMJudge.get_instance(
             model=settings.llm_judge_model,
             base_url=settings.llm_judge_base_url,
             api_key=settings.llm_judge_api_key,
             max_tokens=settings.llm_judge_max_tokens,
             temperature=settings.llm_judge_temperature,
+            validate_model=settings.llm_judge_validate_model,
         )
     else:
         raise ValueError(f"Unsupported verification type: {verification_type}")
 
 
-# Cache for initialized verifiers
+# Verifiers initialized at startup
 verifier_instances = {}
 
-if settings.use_format_verifier:
-    print("Using format verifier")
-    verifier_instances["format_verifier"] = FormatVerifier()
+# Initialization errors of the verifiers that could not be created
+verifier_init_errors = {}
+
+# time.monotonic() of the last initialization attempt of the failed verifiers
+verifier_init_attempts = {}
 
-# List of supported verifier types
-SUPPORTED_VERIFIER_TYPES = [
+# Supported verifier types
+VerificationType = Literal[
     "math_verifiable",
     "code_verifiable",
     "swe_verifiable",
     "llm_judge",
 ]
+SUPPORTED_VERIFIER_TYPES = list(get_args(VerificationType))
+
+# Verifier types that always give the same score for the same input
+DETERMINISTIC_VERIFIER_TYPES = {"math_verifiable", "code_verifiable", "swe_verifiable"}
+
+# LRU cache of the scores of deterministic verifications, keyed by the hashes of
+# the LLM output and of the verification info, so a changed ground truth is a miss
+reward_cache = OrderedDict()
+
+
+@app.on_event("startup")
+async def init_verifiers():
+    """Create every verifier once, so no request pays the initialization cost."""
+    if settings.use_format_verifier:
+        print("Using format verifier")
+        verifier_instances["format_verifier"] = FormatVerifier.get_instance()
+
+    for verification_type in SUPPORTED_VERIFIER_TYPES:
+        try:
+            verifier_instances[verification_type] = get_verifier(verification_type)
+        except Exception as e:
+            # Keep serving the other verification types
+            verifier_init_errors[verification_type] = str(e)
+            verifier_init_attempts[verification_type] = time.monotonic()
+            print(f"Failed to initialize {verification_type} verifier: {str(e)}")
+
+
+async def _get_verifier_instance(verification_type: str):
+    """Return the verifier of a type, retrying to create it if it failed to
+    initialize, at most once per `verifier_init_retry_interval` seconds."""
+    answer_verifier = verifier_instances.get(verification_type)
+    if answer_verifier is not None or verification_type not in verifier_init_errors:
+        return answer_verifier
+
+    now = time.monotonic()
+    last_attempt = verifier_init_attempts.get(verification_type)
+    if (
+        last_attempt is not None
+        and now - last_attempt < settings.verifier_init_retry_interval
+    ):
+        return None
+    verifier_init_attempts[verification_type] = now
+
+    try:
+        # The backend may have been down at startup. Verifiers may do network
+        # I/O while initializing, so don't block the event loop.
+        answer_verifier = await asyncio.to_thread(get_verifier, verification_type)
+    except Exception as e:
+        verifier_init_errors[verification_type] = str(e)
+        print(f"Failed to initialize {verification_type} verifier: {str(e)}")
+        return None
+
+    verifier_instances[verification_type] = answer_verifier
+    del verifier_init_errors[verification_type]
+    del verifier_init_attempts[verification_type]
+    return answer_verifier
+
+
+class VerificationInfo(BaseModel):
+    # Verifiers may read extra fields (e.g. "language"), keep them
+    model_config = ConfigDict(extra="allow")
+
+    type: VerificationType
+    answer: dict
 
 
 class VerificationRequest(BaseModel):
     llm_output: str
-    verification_info: str
+    # A JSON string is still accepted for clients that serialize the object
+    verification_info: Union[VerificationInfo, Json[VerificationInfo]]
 
 
 class VerificationResponse(BaseModel):
@@ -72,59 +188,111 @@ async def ping():
     return {"status": "ok", "message": "RL Verifier service is running"}
 
 
-@app.post("/reward")
-async def compute_reward(item: VerificationRequest) -> VerificationResponse:
-    llm_output = item.llm_output
-    verification_info = item.verification_info
+def _is_cacheable(verification_type: str, answer_verifier) -> bool:
+    if settings.reward_cache_size <= 0:
+        return False
+    if verification_type == "llm_judge":
+        # Only greedy judging is deterministic
+        return answer_verifier.temperature == 0
+    return verification_type in DETERMINISTIC_VERIFIER_TYPES
 
-    # Extract only the assistant's response
-    llm_output = get_assistant_response(llm_output, split_token="<｜Assistant｜>")
 
+def _reward_cache_key(llm_output: str, verification_info: VerificationInfo) -> bytes:
+    # The stdlib json fallback of ORJSONRequest lets lone surrogates through
+    llm_output_hash = hashlib.blake2b(
+        llm_output.encode(errors="surrogatepass"), digest_size=16
+    )
     try:
-        verification_info = json.loads(item.verification_info)
-    except json.JSONDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"The verification info must be in parsable JSON format",
-        )
+        verification_info_json = verification_info.model_dump_json().encode()
+    except PydanticSerializationError:
+        verification_info_json = json.dumps(verification_info.model_dump()).encode()
+    verification_info_hash = hashlib.blake2b(verification_info_json, digest_size=16)
+    return llm_output_hash.digest() + verification_info_hash.digest()
 
-    if "answer" not in verification_info or "type" not in verification_info:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"The verification info must contain 'answer' and 'type' fields. Received: {verification_info}",
-        )
 
-    verification_type = verification_info["type"]
+async def _compute_score(
+    answer_verifier, llm_output: str, verification_info: dict
+) -> float:
+    answer_coro = answer_verifier.averify(llm_output, verification_info)
+
+    if not settings.use_format_verifier:
+        return await answer_coro
+
+    # The answer and format checks are independent, so score them concurrently
+    format_coro = verifier_instances["format_verifier"].averify(
+        llm_output, verification_info
+    )
+    answer_score, format_score = await asyncio.gather(answer_coro, format_coro)
+    return 0.9 * answer_score + 0.1 * format_score
 
-    if verification_type not in SUPPORTED_VERIFIER_TYPES:
+
+async def _score_one(item: VerificationRequest) -> VerificationResponse:
+    # Extract only the assistant's response
+    llm_output = get_assistant_response(item.llm_output, split_token="<｜Assistant｜>")
+
+    verification_type = item.verification_info.type
+    verification_info = item.verification_info.model_dump()
+
+    answer_verifier = await _get_verifier_instance(verification_type)
+    if answer_verifier is None:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"The verification type {verification_type} is not supported.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to initialize {verification_type} verifier: {verifier_init_errors.get(verification_type)}",
         )
 
-    # Initialize the verifier if it hasn't been initialized yet
-    if verification_type not in verifier_instances:
-        try:
-            verifier_instances[verification_type] = get_verifier(verification_type)
-        except VerifierInitializationError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to initialize {verification_type} verifier: {str(e)}",
-            )
-
-    answer_verifier = verifier_instances[verification_type]
-    
-    answer_score = answer_verifier(llm_output, verification_info)
-    
-    if not settings.use_format_verifier:
-        return VerificationResponse(score=answer_score)
-    
-    format_score = verifier_instances["format_verifier"](llm_output, verification_info)
-    score = 0.9 * answer_score + 0.1 * format_score
+    if not _is_cacheable(verification_type, answer_verifier):
+        score = await _compute_score(answer_verifier, llm_output, verification_info)
+        return VerificationResponse(score=score)
+
+    cache_key = _reward_cache_key(llm_output, item.verification_info)
+    score = reward_cache.get(cache_key)
+    if score is not None:
+        reward_cache.move_to_end(cache_key)
+        return VerificationResponse(score=score)
+
+    score = await _compute_score(answer_verifier, llm_output, verification_info)
+    reward_cache[cache_key] = score
+    if len(reward_cache) > settings.reward_cache_size:
+        reward_cache.popitem(last=False)
 
     return VerificationResponse(score=score)
 
 
+@app.post("/reward")
+async def compute_reward(item: VerificationRequest) -> VerificationResponse:
+    return await _score_one(item)
+
+
+@app.post("/reward/batch")
+async def compute_reward_batch(
+    items: list[VerificationRequest],
+) -> list[VerificationResponse]:
+    """
+    Score a batch of LLM outputs concurrently.
+
+    A single failing item fails the whole batch, and the items still being
+    scored are cancelled.
+
+    Returns:
+        list[VerificationResponse]: The scores, in the same order as the input items
+    """
+    if len(items) > settings.max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"The batch contains {len(items)} items, the maximum is {settings.max_batch_size}.",
+        )
+
+    tasks = [asyncio.create_task(_score_one(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # The results would be thrown away, stop the sandbox and judge calls
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 if __name__ == "__main__":
     import uvicorn
 
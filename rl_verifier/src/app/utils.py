@@ -1,3 +1,4 @@
 def get_assistant_response(text: str, split_token: str) -> str:
-    # remove everything before the split_token
-    return text.split(split_token)[-1].strip()
\ No newline at end of file
+    # remove everything before the last split_token, without building the list
+    # of all segments that str.split would
+    return text.rpartition(split_token)[2].strip()
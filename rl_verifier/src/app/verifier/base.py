@@ -1,10 +1,34 @@
+import asyncio
+
 from abc import ABC, abstractmethod
 
 
 class BaseVerifier(ABC):
+    # Shared instances, keyed by verifier class and constructor arguments
+    _instances: dict = {}
+
+    @classmethod
+    def get_instance(cls, **kwargs) -> "BaseVerifier":
+        """Return the shared verifier instance for the given configuration,
+        creating it on first use."""
+        key = (cls, frozenset(kwargs.items()))
+        instance = BaseVerifier._instances.get(key)
+        if instance is None:
+            instance = BaseVerifier._instances.setdefault(key, cls(**kwargs))
+        return instance
+
     @abstractmethod
     def verify(self, llm_output: str, verification_info: dict) -> float:
         pass
 
+    async def averify(self, llm_output: str, verification_info: dict) -> float:
+        """Async counterpart of `verify`.
+
+        Runs the blocking `verify` in a worker thread so it does not stall the
+        event loop. Verifiers doing network I/O should override this with a
+        native async implementation.
+        """
+        return await asyncio.to_thread(self.verify, llm_output, verification_info)
+
     def __call__(self, llm_output: str, verification_info: dict) -> float:
         return self.verify(llm_output, verification_info)
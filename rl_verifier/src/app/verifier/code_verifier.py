@@ -1,14 +1,17 @@
+import asyncio
+import httpx
 import requests
 
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
 from sandbox_fusion import (
     run_concurrent,
-    submit,
+    EvalResult,
     SubmitRequest,
     TestConfig,
-    set_endpoint,
 )
 from .base import BaseVerifier
-from .exception import VerifierInitializationError
+from .exception import VerifierException, VerifierInitializationError
 from .utils import get_code_block
 
 
@@ -19,14 +22,30 @@ class CodeVerifier(BaseVerifier):
         timeout: float = 30,
         max_attempts: int = 1,
         concurrency: int = 5,
+        partial_credit: bool = True,
     ):
         self.base_url = base_url
         self.timeout = timeout
         self.max_attempts = max_attempts
         self.concurrency = concurrency
+        # Score the fraction of passed test cases, or 1.0 only if all of them pass
+        self.partial_credit = partial_credit
+
+        # Keep-alive connections to the sandbox, shared by all submissions
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=2 * self.concurrency,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         self._validate_base_url(self.base_url)
-        set_endpoint(self.base_url)
+        self.base_url = self.base_url.rstrip("/")
+
+        # Created on first use, so it is bound to the server's event loop
+        self._async_client = None
 
     def _validate_base_url(self, base_url: str) -> bool:
         if not base_url or not base_url.strip():
@@ -34,25 +53,76 @@ class CodeVerifier(BaseVerifier):
                 "Fusion Sandbox base URL cannot be empty."
             )
         try:
-            requests.get(f"{base_url}/v1/ping", timeout=5)
+            self.session.get(f"{base_url}/v1/ping", timeout=5)
         except:
             raise VerifierInitializationError(
                 f"Failed to connect Fusion Sandbox at '{self.base_url}'."
             )
 
-    def verify(self, llm_output: str, verification_info: dict) -> float:
+    def _submit(self, request: SubmitRequest) -> EvalResult:
+        """Submit a request to the sandbox, as `sandbox_fusion.submit` does, but
+        over the pooled session."""
+        last_error = None
+        for _ in range(self.max_attempts):
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/submit",
+                    json=request.dict(),
+                    timeout=self.timeout,
+                )
+                if response.status_code != 200:
+                    raise VerifierException(
+                        f"Sandbox responded with code {response.status_code}: {response.text}"
+                    )
+                return EvalResult(**response.json())
+            except (requests.exceptions.RequestException, VerifierException) as e:
+                last_error = e
+
+        raise last_error
+
+    async def _asubmit(self, request: SubmitRequest) -> EvalResult:
+        """Async version of `_submit`."""
+        if self._async_client is None:
+            # Shared by every request of the server, so don't cap the number of
+            # connections: each averify call limits itself to `concurrency`
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=None),
+            )
+
+        last_error = None
+        for _ in range(self.max_attempts):
+            try:
+                response = await self._async_client.post(
+                    f"{self.base_url}/submit", json=request.dict()
+                )
+                if response.status_code != 200:
+                    raise VerifierException(
+                        f"Sandbox responded with code {response.status_code}: {response.text}"
+                    )
+                return EvalResult(**response.json())
+            except (httpx.HTTPError, VerifierException) as e:
+                last_error = e
+
+        raise last_error
+
+    def _build_submit_requests(
+        self, llm_output: str, verification_info: dict
+    ) -> Optional[List[SubmitRequest]]:
+        """Build one sandbox submission per test case, or return None if the
+        output has no code block to run."""
         test_cases = verification_info["answer"]["test_cases"]
         language = verification_info["answer"].get("language", "python")
 
         if not get_code_block(llm_output, language):
-            return 0.0
+            return None
 
         fmt_test_cases = [
             {"input": {"stdin": tc["input"]}, "output": {"stdout": tc["output"]}}
             for tc in test_cases
         ]
 
-        kwargs = []
+        submit_requests = []
         for idx, tc in enumerate(fmt_test_cases):
             submit_request = SubmitRequest(
                 dataset="custom_dataset",
@@ -68,21 +138,53 @@ class CodeVerifier(BaseVerifier):
                     },
                 ),
             )
+            submit_requests.append(submit_request)
 
-            kwargs.append(
-                {
-                    "request": submit_request,
-                    "client_timeout": self.timeout,
-                    "max_attempts": self.max_attempts,
-                }
-            )
+        return submit_requests
+
+    def _score(self, responses: List[EvalResult]) -> float:
+        num_passed = len([item for item in responses if item.tests[0].passed])
+        if not self.partial_credit:
+            return 1.0 if num_passed == len(responses) else 0.0
+
+        return num_passed / len(responses)
+
+    def verify(self, llm_output: str, verification_info: dict) -> float:
+        submit_requests = self._build_submit_requests(llm_output, verification_info)
+        if not submit_requests:
+            return 0.0
 
         responses = run_concurrent(
-            func=submit,
-            kwargs=kwargs,
+            func=self._submit,
+            kwargs=[{"request": request} for request in submit_requests],
             concurrency=self.concurrency,
         )
 
-        num_passed = len([item for item in responses if item.tests[0].passed])
+        return self._score(responses)
 
-        return num_passed / len(responses)
+    async def averify(self, llm_output: str, verification_info: dict) -> float:
+        submit_requests = self._build_submit_requests(llm_output, verification_info)
+        if not submit_requests:
+            return 0.0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def submit(request: SubmitRequest) -> EvalResult:
+            async with semaphore:
+                return await self._asubmit(request)
+
+        tasks = [asyncio.ensure_future(submit(request)) for request in submit_requests]
+        try:
+            if self.partial_credit:
+                responses = await asyncio.gather(*tasks)
+                return self._score(responses)
+
+            # All-or-nothing, so the first failed test case decides the score
+            for next_done in asyncio.as_completed(tasks):
+                response = await next_done
+                if not response.tests[0].passed:
+                    return 0.0
+            return 1.0
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,16 +1,20 @@
-import unicodedata
 import re
 
 from .base import BaseVerifier
 from .utils import get_last_boxed, get_code_block
 
+# CJK unified and compatibility ideographs, including the supplementary ideographic planes
+CJK_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\U00020000-\U0003ffff]")
+
 
 def contains_chinese_language(text: str) -> bool:
-    return any("CJK" in unicodedata.name(char, "") for char in text if char.isalpha())
+    # str.isascii is O(1) in CPython, pure ASCII text needs no scan
+    return not text.isascii() and CJK_RE.search(text) is not None
 
 
 def contains_thinking_block(text: str) -> bool:
-    return re.search(r"<think>.*?</think>", text, re.DOTALL) is not None
+    start_idx = text.find("<think>")
+    return start_idx >= 0 and text.find("</think>", start_idx + 7) >= 0
 
 
 def contains_eos_token(text: str, eos_token="<｜end▁of▁sentence｜>"):
@@ -20,12 +24,13 @@ def contains_eos_token(text: str, eos_token="<｜end▁of▁sentence｜>"):
 
 class FormatVerifier(BaseVerifier):
     def verify(self, llm_output: str, verification_info: dict) -> float:
-        if contains_chinese_language(llm_output):
+        # Cheapest checks first, the full-text Chinese scan last. Each check is a
+        # separate C-level scan (str.find or one character class); fusing them
+        # into a single regex alternation pass measured about 2x slower.
+        if not contains_eos_token(llm_output):
             return 0.0
         if not contains_thinking_block(llm_output):
             return 0.0
-        if not contains_eos_token(llm_output):
-            return 0.0
         if verification_info["type"] == "math_verifiable" and not get_last_boxed(
             llm_output
         ):
@@ -34,5 +39,7 @@ class FormatVerifier(BaseVerifier):
             llm_output, verification_info.get("language", "python")
         ):
             return 0.0
+        if contains_chinese_language(llm_output):
+            return 0.0
 
         return 1.0
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
+import httpx
 
-from openai import OpenAI, AuthenticationError
+from openai import OpenAI, AsyncOpenAI, AuthenticationError
 from .base import BaseVerifier
 from .exception import VerifierInitializationError
 
@@ -25,12 +26,22 @@ class LLMJudge(BaseVerifier):
         api_key: str = None,
         max_tokens: int = 100,
         temperature: float = 0.0,
+        max_connections: int = 64,
+        validate_model: bool = False,
     ):
-        self._init_openai_client(api_key, base_url)
+        if not model:
+            raise VerifierInitializationError(
+                "Model name cannot be empty for LLM Judge Verifier"
+            )
+        self._init_openai_client(api_key, base_url, max_connections)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+        if validate_model:
+            self._validate_model(model, base_url)
+
+    def _validate_model(self, model: str, base_url: str):
         try:
             available_models = self.client.models.list()
             if model not in [m.id for m in available_models]:
@@ -40,32 +51,59 @@ class LLMJudge(BaseVerifier):
         except AuthenticationError as e:
             raise VerifierInitializationError(str(e))
 
-    def _init_openai_client(self, api_key: str, base_url: str):
+    def _init_openai_client(self, api_key: str, base_url: str, max_connections: int):
         api_key = os.getenv("OPENAI_API_KEY") if not api_key else api_key
         if not api_key:
             raise VerifierInitializationError(
                 "OPENAI_API_KEY is not set for LLM Judge Verifier"
             )
+        # Judge calls are concurrent, keep a pool of keep-alive connections to the backend
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
+        )
         if not base_url:
             self.client = OpenAI(api_key=api_key)
+            self.async_client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         else:
             self.client = OpenAI(api_key=api_key, base_url=base_url)
+            self.async_client = AsyncOpenAI(
+                api_key=api_key, base_url=base_url, http_client=http_client
+            )
 
-    def verify(self, llm_output: str, verification_info: dict) -> float:
+    def _build_messages(self, llm_output: str, verification_info: dict) -> list:
         reference_answer = verification_info["answer"]["value"]
         prompt = PROMPT_TEMPLATE.format(
             model_response=llm_output, ground_truth=reference_answer
         )
-        messages = [{"role": "user", "content": prompt}]
-        print(messages)
+        return [{"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _parse_judgement(response) -> float:
+        response = response.choices[0].message.content
+        if response.lower().strip('"') == "true":
+            return 1.0
+        else:
+            return 0.0
+
+    def verify(self, llm_output: str, verification_info: dict) -> float:
+        messages = self._build_messages(llm_output, verification_info)
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
         )
-        response = response.choices[0].message.content
-        if response.lower().strip('"') == "true":
-            return 1.0
-        else:
-            return 0.0
+        return self._parse_judgement(response)
+
+    async def averify(self, llm_output: str, verification_info: dict) -> float:
+        messages = self._build_messages(llm_output, verification_info)
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
+        return self._parse_judgement(response)
@@ -1,9 +1,50 @@
 import math_verify
 
+from collections import OrderedDict
+from functools import wraps
 from .base import BaseVerifier
 from .utils import get_last_boxed
 
 
+def _cache_parses(maxsize: int):
+    """LRU cache of the parses, skipping the empty ones: math_verify returns []
+    when parsing times out, and a later call may well succeed."""
+
+    def decorator(parse):
+        cache = OrderedDict()
+
+        @wraps(parse)
+        def cached_parse(text: str):
+            parsed = cache.get(text)
+            if parsed is not None:
+                cache.move_to_end(text)
+                return parsed
+
+            parsed = parse(text)
+            if parsed:
+                cache[text] = parsed
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return parsed
+
+        return cached_parse
+
+    return decorator
+
+
+# The same ground truth is verified against many sampled outputs during RL
+# training, so its (SymPy) parse is cached. Duplicate predictions are rarer,
+# hence the smaller cache.
+@_cache_parses(maxsize=8192)
+def _parse_ground_truth(ground_truth: str):
+    return math_verify.parse(f"\\boxed{{{ground_truth}}}")
+
+
+@_cache_parses(maxsize=1024)
+def _parse_prediction(extracted_prediction: str):
+    return math_verify.parse(extracted_prediction)
+
+
 class MathVerifier(BaseVerifier):
     def verify(self, llm_output: str, verification_info: dict) -> float:
         ground_truth = verification_info["answer"]["value"]
@@ -15,9 +56,14 @@ class MathVerifier(BaseVerifier):
             return 0.0
 
         # Parse the prediction and the ground truth
-        parsed_prediction = math_verify.parse(extracted_prediction)
-        parsed_ground_truth = math_verify.parse(f"\\boxed{{{ground_truth}}}")
+        parsed_prediction = _parse_prediction(extracted_prediction)
+        parsed_ground_truth = _parse_ground_truth(str(ground_truth))
 
         # Verify the prediction
         verified = math_verify.verify(parsed_prediction, parsed_ground_truth)
         return 1.0 if verified else 0.0
+
+    async def averify(self, llm_output: str, verification_info: dict) -> float:
+        # math_verify enforces its timeouts with signal.alarm, which only works in
+        # the main thread, so verify on the event loop thread instead of a worker
+        return self.verify(llm_output, verification_info)
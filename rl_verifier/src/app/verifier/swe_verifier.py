@@ -3,13 +3,28 @@
 import re
 import difflib
 
+from functools import lru_cache
+from rapidfuzz.distance import Indel
 from .base import BaseVerifier
 
+CODE_BLOCKS_RE = re.compile(r"```([\w#+]+)\n(.*?)```", re.DOTALL)
+LANGUAGE_TAG_RE = re.compile(r"[\w#+]+")
 
-def extract_code_blocks(text):
-    pattern = re.compile(r"```([\w#+]+)\n(.*?)```", re.DOTALL)
 
-    matches = pattern.findall(text)
+def extract_code_blocks(text):
+    # Fast path: slice out the last fenced block by searching backwards for its
+    # closing and opening fences.
+    end_idx = text.rfind("```")
+    start_idx = text.rfind("```", 0, end_idx) if end_idx > 0 else -1
+    if start_idx >= 0:
+        newline_idx = text.find("\n", start_idx + 3, end_idx)
+        if newline_idx >= 0 and LANGUAGE_TAG_RE.fullmatch(
+            text, start_idx + 3, newline_idx
+        ):
+            return text[newline_idx + 1 : end_idx].strip()
+
+    # Irregular fences (e.g. an unclosed trailing block), fall back to the regex
+    matches = CODE_BLOCKS_RE.findall(text)
 
     if matches:
         _, code = matches[-1]  # Get the last match
@@ -60,16 +75,20 @@ def compute_change_similarities(pred_diff: str, oracle_diff: str) -> float:
         return 0.0
 
     else:
-        change_similarity = difflib.SequenceMatcher(
-            None,
-            pred_diff,
-            oracle_diff,
-            autojunk=False,
-        ).ratio()
+        # Same 2 * matches / total length ratio as difflib.SequenceMatcher, but
+        # with an exact LCS computed in C++ instead of the pure Python matcher
+        change_similarity = Indel.normalized_similarity(pred_diff, oracle_diff)
 
         return change_similarity
 
 
+@lru_cache(maxsize=1024)
+def generate_oracle_diff(input_code: str, reference_code: str) -> str:
+    # The oracle diff only depends on the problem, which is scored against many
+    # sampled outputs during RL training
+    return generate_unified_diff(input_code, reference_code)
+
+
 class SWEVerifier(BaseVerifier):
     def verify(self, llm_output: str, verification_info: dict) -> float:
         input_code = verification_info["answer"]["input"].strip()
@@ -79,7 +98,16 @@ class SWEVerifier(BaseVerifier):
         if not llm_output_code:
             return 0.0
 
-        oracle_diff = generate_unified_diff(input_code, reference_code)
+        # Shortcuts for outputs whose diff is known without computing it
+        if llm_output_code == input_code:
+            # Empty change
+            return 0.0
+        oracle_diff = generate_oracle_diff(input_code, reference_code)
+        if not oracle_diff:
+            return 0.0
+        if llm_output_code == reference_code:
+            return 1.0
+
         pred_diff = generate_unified_diff(input_code, llm_output_code)
 
         similarity = compute_change_similarities(pred_diff, oracle_diff)
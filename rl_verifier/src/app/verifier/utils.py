@@ -1,8 +1,14 @@
 import re
 
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=64)
+def _code_block_pattern(language: str) -> re.Pattern:
+    return re.compile(rf"```{re.escape(language)}\n(.*?)```", re.DOTALL)
+
+
 def get_code_block(text: str, language: str) -> Optional[str]:
     """Extract the code block in the given language from the text.
 
@@ -13,8 +19,7 @@ def get_code_block(text: str, language: str) -> Optional[str]:
     Returns:
         str: The code block in the given language, or None if not found
     """
-    pattern = rf"```{language}\n(.*?)```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _code_block_pattern(language).search(text)
 
     return match.group(1) if match else None
 
@@ -32,17 +37,19 @@ def get_last_boxed(text: str) -> Optional[str]:
     if start_idx < 0:
         return None
 
-    right_brace_idx = None
+    # Jump between braces with str.find instead of stepping through every
+    # character in Python
     num_left_braces_open = 0
-    for i in range(start_idx, len(text)):
-        if text[i] == "{":
+    left_brace_idx = text.find("{", start_idx)
+    right_brace_idx = text.find("}", start_idx)
+    while right_brace_idx >= 0:
+        if 0 <= left_brace_idx < right_brace_idx:
             num_left_braces_open += 1
-        if text[i] == "}":
+            left_brace_idx = text.find("{", left_brace_idx + 1)
+        else:
             num_left_braces_open -= 1
             if num_left_braces_open == 0:
-                right_brace_idx = i
-                break
+                return text[start_idx : right_brace_idx + 1]
+            right_brace_idx = text.find("}", right_brace_idx + 1)
 
-    if not right_brace_idx:
-        return None
-    return text[start_idx : right_brace_idx + 1]
+    return None
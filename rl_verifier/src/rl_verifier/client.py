@@ -1,21 +1,113 @@
-import json
+import asyncio
+import hashlib
+import httpx
+import logging
+import orjson
+import os
 import requests
-import random
-import time
-import http.client
+import itertools
+import socket
+import threading
 
-from typing import Dict, Any, Union, List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import ConnectTimeoutError, InvalidHeader, NewConnectionError
+from urllib3.util import Retry
+from typing import Dict, Any, Optional, Union, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from .exception import (
     RLVerifierError,
     ConnectionError,
     ValidationError,
     ServerError,
+    PayloadTooLargeError,
     TimeoutError,
     VerificationError,
 )
-from .utils import ensure_json_serializable
+from .utils import ensure_json_serializable_bytes
+
+
+logger = logging.getLogger(__name__)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Statuses of transient server failures, retried by the session
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Upper bound of the default number of verify_batch workers
+MAX_DEFAULT_WORKERS = 64
+
+# Number of items sent per /reward/batch request, lowered if the server
+# rejects batches this large
+BULK_CHUNK_SIZE = 64
+
+# A unique (llm_output, verification_info) pair of a batch still to be scored:
+# the indices it appears at in the batch, its cache key and its request body
+PendingItem = Tuple[List[int], Optional[bytes], bytes]
+
+
+def _failed_to_connect(error: requests.exceptions.RequestException) -> bool:
+    """Whether a request failed before reaching the server, as opposed to e.g.
+    a read timeout, after which the server may still be processing it."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    # Once the session's retries are exhausted, the urllib3 error is the reason
+    # of the MaxRetryError wrapped by requests
+    reason = getattr(error.args[0] if error.args else None, "reason", None)
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+class BackoffRetry(Retry):
+    """Retry waiting initial_delay before the first retry, then multiplying the
+    delay by delay_factor after each retry, up to max_delay. urllib3's own
+    backoff retries immediately once and always doubles the delay."""
+
+    def __init__(
+        self,
+        *args,
+        initial_delay: float = 2.0,
+        delay_factor: float = 2.0,
+        max_delay: float = 10.0,
+        **kwargs,
+    ):
+        self.initial_delay = initial_delay
+        self.delay_factor = delay_factor
+        self.max_delay = max_delay
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kwargs) -> "BackoffRetry":
+        retry = super().new(**kwargs)
+        retry.initial_delay = self.initial_delay
+        retry.delay_factor = self.delay_factor
+        retry.max_delay = self.max_delay
+        return retry
+
+    def get_backoff_time(self) -> float:
+        # Only count the last run of consecutive errors, not redirects
+        consecutive_errors = len(
+            list(
+                itertools.takewhile(
+                    lambda x: x.redirect_location is None, reversed(self.history)
+                )
+            )
+        )
+        if consecutive_errors == 0:
+            return 0
+        delay = self.initial_delay * self.delay_factor ** (consecutive_errors - 1)
+        return min(delay, self.max_delay)
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter enabling TCP keepalive on its sockets, on top of urllib3's
+    default TCP_NODELAY, so idle pooled connections are not silently dropped."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
 
 
 class RLVerifierClient:
@@ -31,6 +123,8 @@ class RLVerifierClient:
         initial_retry_delay: float = 2.0,
         max_retry_delay: float = 10.0,
         retry_backoff_factor: float = 2.0,
+        pool_maxsize: int = 64,
+        cache_size: int = 100_000,
     ):
         """Initialize the RL Verifier client.
 
@@ -41,13 +135,56 @@ class RLVerifierClient:
             initial_retry_delay: Initial delay between retries in seconds
             max_retry_delay: Maximum delay between retries in seconds
             retry_backoff_factor: Factor to multiply delay by after each retry
+            pool_maxsize: Maximum number of keep-alive connections kept per server
+            cache_size: Maximum number of scores kept in the client-side cache (0 disables it)
         """
         if isinstance(base_url, list):
             self.base_urls = [url.rstrip("/") for url in base_url]
         else:
             self.base_urls = [base_url.rstrip("/")]
+
+        # Share keep-alive connections across requests and verify_batch threads
+        self._session = requests.Session()
+        # Transient failures are retried by urllib3 on the pooled connections
+        retry = BackoffRetry(
+            total=max_retries,
+            initial_delay=initial_retry_delay,
+            delay_factor=retry_backoff_factor,
+            max_delay=max_retry_delay,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = KeepAliveHTTPAdapter(
+            pool_connections=max(8, len(self.base_urls)),
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=retry,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Also used by _amake_request to read Retry-After like the session
+        self._retry = retry
+        # A /reward/batch request that failed after being sent may still be
+        # running on the server, don't send the whole chunk again: the chunk
+        # falls back to per-item requests instead
+        bulk_adapter = KeepAliveHTTPAdapter(
+            pool_connections=max(8, len(self.base_urls)),
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=retry.new(read=0),
+        )
         for base_url in self.base_urls:
-            rsp = requests.get(f"{base_url}/ping", timeout=5)
+            self._session.mount(f"{base_url}/reward/batch", bulk_adapter)
+
+        # Round-robin over the servers
+        self._url_iter = itertools.cycle(self.base_urls)
+        self._url_lock = threading.Lock()
+
+        # The ping also opens the first pooled connection to each server
+        for base_url in self.base_urls:
+            rsp = self._session.get(f"{base_url}/ping", timeout=5)
             if rsp.status_code != 200:
                 raise RLVerifierError(f"Failed to connect {base_url}: {rsp.text}")
 
@@ -56,161 +193,639 @@ class RLVerifierClient:
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
         self.retry_backoff_factor = retry_backoff_factor
+        self.pool_maxsize = pool_maxsize
+
+        # Created on first use by verify_batch_async
+        self._async_client = None
+        self._async_client_loop = None
+
+        # Whether the servers expose /reward/batch, probed on first use
+        self._bulk_supported = None
+        self._bulk_chunk_size = BULK_CHUNK_SIZE
+
+        # LRU cache of the scores, keyed by the hash of the LLM output and
+        # of the verification info. Shared by the verify_batch threads.
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def close(self):
+        """Close the connections held by the client."""
+        self._session.close()
+
+    async def aclose(self):
+        """Close the connections held by the client, including the async ones."""
+        self.close()
+        if self._async_client is not None:
+            # Its connections belong to the loop it was created on
+            if self._async_client_loop is asyncio.get_running_loop():
+                await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _handle_response(
+        self, response: Union[requests.Response, httpx.Response]
+    ) -> Dict[str, Any]:
         """Handle the response from the API.
 
         Args:
-            response: The response object from the requests library
+            response: The response object from the requests or httpx library
 
         Returns:
             The parsed JSON response
         """
+        if response.status_code == 422:
+            raise ValidationError(f"Invalid request data: {response.text}")
+        elif response.status_code == 400:
+            raise VerificationError(f"Verification failed: {response.text}")
+        elif response.status_code == 413:
+            raise PayloadTooLargeError(f"Request too large: {response.text}")
+        elif response.status_code >= 400:
+            raise ServerError(f"Server error: {response.text}")
+
         try:
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError:
-            if response.status_code == 422:
-                raise ValidationError(f"Invalid request data: {response.text}")
-            elif response.status_code == 400:
-                raise VerificationError(f"Verification failed: {response.text}")
-            else:
-                raise ServerError(f"Server error: {response.text}")
-        except json.JSONDecodeError:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             raise ServerError(f"Failed to parse response as JSON: {response.text}")
 
-    def _make_request(self, base_url: str, payload: Dict[str, Any]) -> float:
-        """Make a request to the verifier server with retry logic.
+    def _make_request(
+        self, base_url: str, body: bytes, endpoint: str = "/reward"
+    ) -> Any:
+        """Make a request to the verifier server.
+
+        Transient failures are retried by the session. If the server is still
+        unreachable, the request fails over to the other servers.
 
         Args:
             base_url: The base URL to make the request to
-            payload: The request payload
+            body: The JSON-encoded request body
+            endpoint: The endpoint to post the body to
 
         Returns:
-            The verification score
+            The parsed JSON response
         """
-        retry_delay = self.initial_retry_delay
         last_error = None
 
-        for attempt in range(self.max_retries + 1):
+        base_urls = [base_url] + [url for url in self.base_urls if url != base_url]
+        for base_url in base_urls:
             try:
-                response = requests.post(
-                    f"{base_url}/reward", json=payload, timeout=self.timeout
+                response = self._session.post(
+                    f"{base_url}{endpoint}",
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout,
                 )
-                response_data = self._handle_response(response)
-                return response_data["score"]
-            except (requests.exceptions.ConnectionError, http.client.RemoteDisconnected) as e:
-                last_error = ConnectionError(f"Failed to connect to the server: {str(e)}")
             except requests.exceptions.Timeout as e:
                 last_error = TimeoutError(f"Request timed out: {str(e)}")
-            except (ValidationError, ServerError, VerificationError):
-                # Re-raise these exceptions as they're already properly typed
-                raise
+                if endpoint == "/reward/batch" and not _failed_to_connect(e):
+                    # The batch may still be running on the server, don't send
+                    # it to another one
+                    raise last_error
+            except requests.exceptions.ConnectionError as e:
+                last_error = ConnectionError(f"Failed to connect to the server: {str(e)}")
+                if endpoint == "/reward/batch" and not _failed_to_connect(e):
+                    raise last_error
             except Exception as e:
-                last_error = RLVerifierError(f"Unexpected error: {str(e)}")
+                raise RLVerifierError(f"Unexpected error: {str(e)}")
+            else:
+                return self._handle_response(response)
+
+        raise last_error
+
+    async def _amake_request(
+        self, base_url: str, body: bytes, endpoint: str = "/reward"
+    ) -> Any:
+        """Async counterpart of `_make_request`, using the shared httpx client.
+
+        Retries like the session: transient failures and RETRY_STATUSES
+        responses are retried with the same backoff, honouring Retry-After,
+        then the request fails over to the other servers in order.
+        """
+        last_error = None
+
+        base_urls = [base_url] + [url for url in self.base_urls if url != base_url]
+        for base_url in base_urls:
+            retry_delay = self.initial_retry_delay
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = await self._async_client.post(
+                        f"{base_url}{endpoint}", content=body, headers=JSON_HEADERS
+                    )
+                except httpx.TransportError as e:
+                    if isinstance(e, httpx.TimeoutException):
+                        last_error = TimeoutError(f"Request timed out: {str(e)}")
+                    else:
+                        last_error = ConnectionError(f"Failed to connect to the server: {str(e)}")
+                    if endpoint == "/reward/batch" and not isinstance(
+                        e, (httpx.ConnectError, httpx.ConnectTimeout)
+                    ):
+                        # Like the session, don't send a batch that may still be
+                        # running on the server again
+                        raise last_error
+                    delay = retry_delay
+                except Exception as e:
+                    raise RLVerifierError(f"Unexpected error: {str(e)}")
+                else:
+                    if (
+                        response.status_code not in RETRY_STATUSES
+                        or attempt == self.max_retries
+                    ):
+                        return self._handle_response(response)
+                    delay = retry_delay
+                    if response.status_code in Retry.RETRY_AFTER_STATUS_CODES:
+                        try:
+                            retry_after = self._retry.get_retry_after(response)
+                        except InvalidHeader:
+                            retry_after = None
+                        if retry_after is not None:
+                            delay = retry_after
 
-            if attempt < self.max_retries and (isinstance(last_error, ConnectionError) or isinstance(last_error, TimeoutError)):
-                print(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay = min(retry_delay * self.retry_backoff_factor, self.max_retry_delay)
-                # Try a different base URL if available
-                if len(self.base_urls) > 1:
-                    base_url = random.choice([url for url in self.base_urls if url != base_url])
+                if attempt < self.max_retries:
+                    logger.debug("Retrying in %s seconds...", delay)
+                    await asyncio.sleep(delay)
+                    retry_delay = min(
+                        retry_delay * self.retry_backoff_factor, self.max_retry_delay
+                    )
 
         raise last_error
 
+    def _pick_url(self) -> str:
+        if len(self.base_urls) == 1:
+            return self.base_urls[0]
+        with self._url_lock:
+            return next(self._url_iter)
+
+    @staticmethod
+    def _build_body(llm_output: str, verification_info: bytes) -> bytes:
+        # Build the body directly instead of serializing a payload dict. The
+        # verification info goes as a JSON string, which older servers (that
+        # expect `verification_info: str`) accept too.
+        return (
+            b'{"llm_output":'
+            + orjson.dumps(llm_output)
+            + b',"verification_info":'
+            + orjson.dumps(verification_info.decode())
+            + b"}"
+        )
+
+    @staticmethod
+    def _cache_key(llm_output: str, verification_info: bytes) -> bytes:
+        return hashlib.blake2b(
+            llm_output.encode() + b"\x00" + verification_info, digest_size=16
+        ).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[float]:
+        with self._cache_lock:
+            score = self._cache.get(key)
+            if score is not None:
+                self._cache.move_to_end(key)
+            return score
+
+    def _cache_put(self, key: bytes, score: float):
+        with self._cache_lock:
+            self._cache[key] = score
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def verify(
-        self, llm_output: str, verification_info: Union[str, Dict[str, Any]]
+        self,
+        llm_output: str,
+        verification_info: Union[str, bytes, Dict[str, Any]],
+        cache: bool = True,
+        skip_empty: bool = True,
+        trust_input: bool = False,
     ) -> float:
         """
         Compute the reward for an LLM output.
 
         Args:
             llm_output: The output from the LLM to be verified
-            verification_info: Verification information as a JSON string or dictionary
+            verification_info: Verification information as a JSON string, JSON bytes or dictionary
                                Must contain 'answer' and 'type' fields
+            cache: Whether to reuse the score of an identical earlier request (default: True).
+                   Pass False for non-deterministic verifications, e.g. LLM-as-Judge with sampling
+            skip_empty: Whether to score an empty LLM output 0.0 without calling the server
+                        (default: True)
+            trust_input: Whether to send a JSON string or bytes verification_info without
+                         validating it first; invalid JSON is then rejected by the server
+                         (default: False)
 
         Returns:
             The verification score between 0 and 1
         """
-        base_url = random.choice(self.base_urls)
-        verification_info_str = ensure_json_serializable(verification_info)
-        payload = {"llm_output": llm_output, "verification_info": verification_info_str}
-        
-        return self._make_request(base_url, payload)
+        verification_info_bytes = ensure_json_serializable_bytes(
+            verification_info, trust_input
+        )
+
+        # An empty output has nothing to verify, spare the round trip
+        if skip_empty and not llm_output.strip():
+            return 0.0
+
+        use_cache = cache and self.cache_size > 0
+        if use_cache:
+            cache_key = self._cache_key(llm_output, verification_info_bytes)
+            score = self._cache_get(cache_key)
+            if score is not None:
+                return score
+
+        body = self._build_body(llm_output, verification_info_bytes)
+        score = self._make_request(self._pick_url(), body)["score"]
+
+        if use_cache:
+            self._cache_put(cache_key, score)
+        return score
 
     def verify_safe(
         self,
         llm_output: str,
-        verification_info: Union[str, Dict[str, Any]],
+        verification_info: Union[str, bytes, Dict[str, Any]],
         default_value: float = 0.0,
+        cache: bool = True,
+        skip_empty: bool = True,
+        trust_input: bool = False,
     ) -> float:
         """
         Compute the reward for an LLM output, returning a default value if any error occurs.
 
         Args:
             llm_output: The output from the LLM to be verified
-            verification_info: Verification information as a JSON string or dictionary
+            verification_info: Verification information as a JSON string, JSON bytes or dictionary
                                Must contain 'answer' and 'type' fields
             default_value: Value to return if verification fails (default: 0.0)
+            cache: Whether to reuse the score of an identical earlier request (default: True)
+            skip_empty: Whether to score an empty LLM output 0.0 without calling the server
+                        (default: True)
+            trust_input: Whether to send a JSON string or bytes verification_info without
+                         validating it first; invalid JSON is then rejected by the server
+                         (default: False)
 
         Returns:
             The verification score between 0 and 1, or default_value if an error occurs
         """
         try:
-            return self.verify(llm_output, verification_info)
+            return self.verify(
+                llm_output,
+                verification_info,
+                cache=cache,
+                skip_empty=skip_empty,
+                trust_input=trust_input,
+            )
         except Exception as e:
-            print(f"Verification error (returning {default_value}): {str(e)}")
+            logger.warning("Verification error (returning %s): %s", default_value, e)
             return default_value
 
+    def _bulk_available(self) -> bool:
+        """Whether the servers expose /reward/batch, probed once with an empty batch."""
+        if self._bulk_supported is None:
+            try:
+                response = self._session.post(
+                    f"{self.base_urls[0]}/reward/batch",
+                    data=b"[]",
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.RequestException:
+                # Don't remember a transient failure
+                return False
+            self._bulk_supported = response.status_code == 200
+        return self._bulk_supported
+
+    def _prepare_batch(
+        self,
+        batch: List[Tuple[str, Union[str, bytes, Dict[str, Any]]]],
+        scores: List[float],
+        cache: bool,
+        skip_empty: bool,
+        trust_input: bool,
+    ) -> List[PendingItem]:
+        """Fill in the scores known without the server and encode the other items.
+
+        Returns:
+            The unique items to send to the server
+        """
+        use_cache = cache and self.cache_size > 0
+        # Identical pairs of the batch are sent once
+        pending = {}
+        # Rollouts of the same prompt usually share one verification info object,
+        # encode it once. The batch keeps the objects alive, so their ids are not
+        # reused while the loop runs.
+        encoded = {}
+        for index, (llm_output, verification_info) in enumerate(batch):
+            try:
+                verification_info_bytes = encoded.get(id(verification_info))
+                if verification_info_bytes is None:
+                    verification_info_bytes = ensure_json_serializable_bytes(
+                        verification_info, trust_input
+                    )
+                    encoded[id(verification_info)] = verification_info_bytes
+
+                if skip_empty and not llm_output.strip():
+                    scores[index] = 0.0
+                    continue
+
+                cache_key = None
+                if use_cache:
+                    cache_key = self._cache_key(llm_output, verification_info_bytes)
+                    score = self._cache_get(cache_key)
+                    if score is not None:
+                        scores[index] = score
+                        continue
+
+                item = pending.get((llm_output, verification_info_bytes))
+                if item is not None:
+                    item[0].append(index)
+                    continue
+
+                pending[llm_output, verification_info_bytes] = (
+                    [index],
+                    cache_key,
+                    self._build_body(llm_output, verification_info_bytes),
+                )
+            except Exception as e:
+                # E.g. a None output or one that is not valid UTF-8, leave the
+                # default score for this item only
+                logger.warning("Error processing index %d: %s", index, e)
+        return list(pending.values())
+
+    def _verify_items(
+        self, chunk: List[PendingItem]
+    ) -> List[Optional[float]]:
+        """Score the items one request at a time, None for the failed ones."""
+        scores = []
+        for indices, _, body in chunk:
+            try:
+                scores.append(self._make_request(self._pick_url(), body)["score"])
+            except Exception as e:
+                logger.warning("Error processing indices %s: %s", indices, e)
+                scores.append(None)
+        return scores
+
+    def _verify_chunk(
+        self, chunk: List[PendingItem]
+    ) -> List[Optional[float]]:
+        """Score the items with a single /reward/batch request, None for the failed ones."""
+        body = b"[" + b",".join(item_body for _, _, item_body in chunk) + b"]"
+        try:
+            response_data = self._make_request(self._pick_url(), body, "/reward/batch")
+            return [item["score"] for item in response_data]
+        except PayloadTooLargeError:
+            if len(chunk) == 1:
+                return self._verify_items(chunk)
+            # The server allows smaller batches, split the chunk and use the
+            # smaller size from now on
+            half = len(chunk) // 2
+            self._bulk_chunk_size = min(self._bulk_chunk_size, half)
+            return self._verify_chunk(chunk[:half]) + self._verify_chunk(chunk[half:])
+        except (
+            ValidationError,
+            VerificationError,
+            ServerError,
+            TimeoutError,
+            ConnectionError,
+        ):
+            # A single failing item (invalid, or raising in its verifier) fails
+            # the whole request, and a slow one can make it time out. Score the
+            # items one by one, each with its own timeout and retries, so the
+            # others still get a score.
+            return self._verify_items(chunk)
+        except Exception as e:
+            logger.warning("Error processing a chunk of %d items: %s", len(chunk), e)
+            return [None] * len(chunk)
+
+    async def _averify_items(
+        self, chunk: List[PendingItem]
+    ) -> List[Optional[float]]:
+        """Async counterpart of `_verify_items`."""
+        scores = []
+        for indices, _, body in chunk:
+            try:
+                response_data = await self._amake_request(self._pick_url(), body)
+                scores.append(response_data["score"])
+            except Exception as e:
+                logger.warning("Error processing indices %s: %s", indices, e)
+                scores.append(None)
+        return scores
+
+    async def _averify_chunk(
+        self, chunk: List[PendingItem]
+    ) -> List[Optional[float]]:
+        """Async counterpart of `_verify_chunk`."""
+        body = b"[" + b",".join(item_body for _, _, item_body in chunk) + b"]"
+        try:
+            response_data = await self._amake_request(
+                self._pick_url(), body, "/reward/batch"
+            )
+            return [item["score"] for item in response_data]
+        except PayloadTooLargeError:
+            if len(chunk) == 1:
+                return await self._averify_items(chunk)
+            half = len(chunk) // 2
+            self._bulk_chunk_size = min(self._bulk_chunk_size, half)
+            return await self._averify_chunk(chunk[:half]) + await self._averify_chunk(
+                chunk[half:]
+            )
+        except (
+            ValidationError,
+            VerificationError,
+            ServerError,
+            TimeoutError,
+            ConnectionError,
+        ):
+            return await self._averify_items(chunk)
+        except Exception as e:
+            logger.warning("Error processing a chunk of %d items: %s", len(chunk), e)
+            return [None] * len(chunk)
+
+    def _store_chunk_scores(
+        self,
+        chunk: List[PendingItem],
+        chunk_scores: List[Optional[float]],
+        scores: List[float],
+    ):
+        for (indices, cache_key, _), score in zip(chunk, chunk_scores):
+            if score is None:
+                continue
+            for index in indices:
+                scores[index] = score
+            if cache_key is not None:
+                self._cache_put(cache_key, score)
+
     def verify_batch(
         self,
-        batch: List[Tuple[str, Union[str, Dict[str, Any]]]],
-        max_workers: int = 5,
+        batch: List[Tuple[str, Union[str, bytes, Dict[str, Any]]]],
+        max_workers: Optional[int] = None,
         default_value: float = 0.0,
         progress_bar: bool = True,
+        cache: bool = True,
+        skip_empty: bool = True,
+        trust_input: bool = False,
     ) -> list[float]:
         """
         Compute rewards for multiple LLM outputs in parallel.
 
+        When the server exposes /reward/batch, the items are sent in chunks of at
+        most BULK_CHUNK_SIZE (fewer if the server rejects batches that large),
+        otherwise one request is made per item. A chunk the server fails as a
+        whole is retried item by item.
+
         Args:
             batch: List of tuples, each containing (llm_output, verification_info)
-                  where verification_info is a JSON string or dictionary
-            max_workers: Maximum number of concurrent workers for processing
+                  where verification_info is a JSON string, JSON bytes or dictionary
+            max_workers: Maximum number of concurrent workers for processing.
+                         Defaults to 4 per CPU (at least 16, at most 64), as the workers
+                         mostly wait on the network
             default_value: Value to return if verification fails (default: 0.0)
             progress_bar: Whether to show a progress bar (default: True)
+            cache: Whether to reuse the scores of identical earlier requests (default: True)
+            skip_empty: Whether to score empty LLM outputs 0.0 without calling the server
+                        (default: True)
+            trust_input: Whether to send a JSON string or bytes verification_info without
+                         validating it first; invalid JSON is then rejected by the server
+                         (default: False)
 
         Returns:
             List of verification scores between 0 and 1, in the same order as the input batch
         """
-        assert len(batch) > 0
+        if not batch:
+            return []
+        if len(batch) == 1:
+            # Not worth a thread pool
+            llm_output, verification_info = batch[0]
+            return [
+                self.verify_safe(
+                    llm_output,
+                    verification_info,
+                    default_value,
+                    cache,
+                    skip_empty,
+                    trust_input,
+                )
+            ]
 
-        items = [
-            (i, llm_output, verification_info)
-            for i, (llm_output, verification_info) in enumerate(batch)
+        scores = [default_value] * len(batch)
+        pending = self._prepare_batch(batch, scores, cache, skip_empty, trust_input)
+        num_pending = sum(len(indices) for indices, _, _ in pending)
+
+        if self._bulk_available():
+            chunk_size, verify_chunk = self._bulk_chunk_size, self._verify_chunk
+        else:
+            chunk_size, verify_chunk = 1, self._verify_items
+        chunks = [
+            pending[start : start + chunk_size]
+            for start in range(0, len(pending), chunk_size)
         ]
-        scores = [default_value] * len(items)
 
-        def process_single(item):
-            _, llm_output, verification_info = item
-            return self.verify_safe(llm_output, verification_info, default_value)
+        if max_workers is None:
+            max_workers = min(
+                len(chunks),
+                max(16, (os.cpu_count() or 2) * 4),
+                MAX_DEFAULT_WORKERS,
+            )
+
+        pbar = (
+            tqdm(total=len(batch), initial=len(batch) - num_pending)
+            if progress_bar
+            else None
+        )
+        try:
+            if chunks:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # The results come back in the order of the chunks
+                    for chunk, chunk_scores in zip(
+                        chunks, executor.map(verify_chunk, chunks)
+                    ):
+                        self._store_chunk_scores(chunk, chunk_scores, scores)
+                        if pbar is not None:
+                            pbar.update(sum(len(indices) for indices, _, _ in chunk))
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+        return scores
+
+    async def verify_batch_async(
+        self,
+        batch: List[Tuple[str, Union[str, bytes, Dict[str, Any]]]],
+        concurrency: int = 64,
+        default_value: float = 0.0,
+        progress_bar: bool = True,
+        cache: bool = True,
+        skip_empty: bool = True,
+        trust_input: bool = False,
+    ) -> list[float]:
+        """
+        Compute rewards for multiple LLM outputs concurrently on the running event loop.
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(process_single, item): item[0] for item in items
-            }
+        When the server exposes /reward/batch, the items are sent in chunks of at
+        most BULK_CHUNK_SIZE (fewer if the server rejects batches that large),
+        otherwise one request is made per item. A chunk the server fails as a
+        whole is retried item by item.
 
-            loop = (
-                tqdm(as_completed(future_to_index), total=len(items))
-                if progress_bar
-                else as_completed(future_to_index)
+        Args:
+            batch: List of tuples, each containing (llm_output, verification_info)
+                  where verification_info is a JSON string, JSON bytes or dictionary
+            concurrency: Maximum number of requests in flight
+            default_value: Value to return if verification fails (default: 0.0)
+            progress_bar: Whether to show a progress bar (default: True)
+            cache: Whether to reuse the scores of identical earlier requests (default: True)
+            skip_empty: Whether to score empty LLM outputs 0.0 without calling the server
+                        (default: True)
+            trust_input: Whether to send a JSON string or bytes verification_info without
+                         validating it first; invalid JSON is then rejected by the server
+                         (default: False)
+
+        Returns:
+            List of verification scores between 0 and 1, in the same order as the input batch
+        """
+        if not batch:
+            return []
+
+        # The httpx client is bound to the event loop it was created on, make a
+        # new one when called from another loop (e.g. a second asyncio.run)
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=max(concurrency, self.pool_maxsize),
+                    max_keepalive_connections=self.pool_maxsize,
+                ),
             )
+            self._async_client_loop = loop
 
-            for future in loop:
-                index = future_to_index[future]
-                try:
-                    scores[index] = future.result()
-                except Exception as e:
-                    print(f"Error processing index {index}: {e}")
+        scores = [default_value] * len(batch)
+        pending = self._prepare_batch(batch, scores, cache, skip_empty, trust_input)
+        num_pending = sum(len(indices) for indices, _, _ in pending)
+
+        if self._bulk_supported is None:
+            await asyncio.to_thread(self._bulk_available)
+        if self._bulk_supported:
+            chunk_size, verify_chunk = self._bulk_chunk_size, self._averify_chunk
+        else:
+            chunk_size, verify_chunk = 1, self._averify_items
+        chunks = [
+            pending[start : start + chunk_size]
+            for start in range(0, len(pending), chunk_size)
+        ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        pbar = (
+            tqdm(total=len(batch), initial=len(batch) - num_pending)
+            if progress_bar
+            else None
+        )
+
+        async def process_chunk(chunk):
+            async with semaphore:
+                chunk_scores = await verify_chunk(chunk)
+            self._store_chunk_scores(chunk, chunk_scores, scores)
+            if pbar is not None:
+                pbar.update(sum(len(indices) for indices, _, _ in chunk))
+
+        try:
+            await asyncio.gather(*[process_chunk(chunk) for chunk in chunks])
+        finally:
+            if pbar is not None:
+                pbar.close()
 
         return scores
@@ -32,3 +32,9 @@ class VerificationError(RLVerifierError):
     """Raised when the verification fails."""
 
     pass
+
+
+class PayloadTooLargeError(ServerError):
+    """Raised when the server rejects a request body or batch as too large."""
+
+    pass
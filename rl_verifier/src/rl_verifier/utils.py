@@ -1,29 +1,74 @@
-import json
+import orjson
 from typing import Dict, Any, Union
 
 
-def ensure_json_serializable(data: Union[str, Dict[str, Any]]) -> str:
+def _validate_json(data: Union[str, bytes]):
+    try:
+        orjson.loads(data)
+    except orjson.JSONDecodeError:
+        raise ValueError("The provided string is not valid JSON")
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    # Like json.dumps, accept non-string keys
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def ensure_json_serializable(
+    data: Union[str, bytes, Dict[str, Any]], trust_input: bool = False
+) -> str:
     """
     Ensures that the data is a JSON serializable string.
 
     Args:
-        data: Either a JSON string or a dictionary
+        data: Either a JSON string, JSON bytes or a dictionary
+        trust_input: Whether to return a JSON string or bytes without validating it
 
     Returns:
         A JSON string
     """
     if isinstance(data, str):
-        # Validate that the string is valid JSON
-        try:
-            json.loads(data)
-            return data
-        except json.JSONDecodeError:
-            raise ValueError("The provided string is not valid JSON")
+        if not trust_input:
+            _validate_json(data)
+        return data
+    elif isinstance(data, (bytes, bytearray)):
+        if not trust_input:
+            _validate_json(data)
+        return data.decode()
     elif isinstance(data, dict):
         # Convert dictionary to JSON string
-        return json.dumps(data)
+        return _dumps(data).decode()
+    else:
+        raise TypeError("Data must be either a JSON string, JSON bytes or a dictionary")
+
+
+def ensure_json_serializable_bytes(
+    data: Union[str, bytes, Dict[str, Any]], trust_input: bool = False
+) -> bytes:
+    """
+    Same as `ensure_json_serializable`, but returns the UTF-8 encoded JSON, ready
+    to be embedded in a request body.
+
+    Args:
+        data: Either a JSON string, JSON bytes or a dictionary
+        trust_input: Whether to return a JSON string or bytes without validating it
+
+    Returns:
+        A JSON document as bytes
+    """
+    if isinstance(data, str):
+        if not trust_input:
+            _validate_json(data)
+        return data.encode()
+    elif isinstance(data, (bytes, bytearray)):
+        # Already encoded, pass it through
+        if not trust_input:
+            _validate_json(data)
+        return bytes(data)
+    elif isinstance(data, dict):
+        return _dumps(data)
     else:
-        raise TypeError("Data must be either a JSON string or a dictionary")
+        raise TypeError("Data must be either a JSON string, JSON bytes or a dictionary")
 
 
 def parse_response(response_text: str) -> Dict[str, Any]:
@@ -37,6 +82,6 @@ def parse_response(response_text: str) -> Dict[str, Any]:
         A dictionary containing the parsed response
     """
     try:
-        return json.loads(response_text)
-    except json.JSONDecodeError:
+        return orjson.loads(response_text)
+    except orjson.JSONDecodeError:
         raise ValueError(f"Failed to parse response as JSON: {response_text}")